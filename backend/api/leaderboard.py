@@ -15,7 +15,11 @@
 #  All endpoints return JSON responses with appropriate HTTP status codes.
 #
 
-from flask import Blueprint, request, jsonify
+import re
+from typing import Optional
+
+import orjson
+from flask import Blueprint, Response, request
 from services.leaderboard_service import leaderboard_service
 
 
@@ -26,6 +30,62 @@ from services.leaderboard_service import leaderboard_service
 # Create Blueprint with /api/leaderboard prefix
 leaderboard_bp = Blueprint("leaderboard", __name__, url_prefix="/api/leaderboard")
 
+# A legitimate score submission is ~80 bytes of JSON; anything bigger
+# than this is rejected before parsing
+MAX_BODY_BYTES = 1024
+
+# YYYY-MM-DD shape check, compiled once at import
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Shared headers for responses built by _resp
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _resp(obj: dict, status: int) -> Response:
+    """
+    Builds a JSON response from orjson-encoded bytes directly, skipping
+    jsonify's provider lookup and config checks.
+    """
+    return Response(orjson.dumps(obj), status, headers=_JSON_HEADERS)
+
+
+# Required fields of a score submission, checked in one pass
+_SCORE_FIELDS = ("guesses", "time_seconds", "puzzle_date")
+
+
+def _validate_score_payload(data: dict) -> Optional[str]:
+    """
+    Validates a parsed score submission in a single pass.
+
+    Returns an error message for the 400 response, or None when the
+    payload is valid.
+    """
+    missing = [field for field in _SCORE_FIELDS if field not in data]
+    if missing:
+        return f"Missing required fields: {', '.join(missing)}"
+
+    guesses = data["guesses"]
+    if not isinstance(guesses, int) or not 1 <= guesses <= 6:
+        return "guesses must be an integer between 1 and 6"
+
+    time_seconds = data["time_seconds"]
+    if not isinstance(time_seconds, int) or time_seconds < 0:
+        return "time_seconds must be a non-negative integer"
+
+    puzzle_date = data["puzzle_date"]
+    if not isinstance(puzzle_date, str) or not _DATE_RE.fullmatch(puzzle_date):
+        return "puzzle_date must be in YYYY-MM-DD format"
+
+    return None
+
+
+# Health responses never change — encode the body once at import so the
+# endpoint (polled constantly by load balancers) does no per-request work
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "wordle-leaderboard"
+})
+
 
 # ------------------------------------------------------------------------------
 # MARK: - POST /api/leaderboard/score
@@ -66,80 +126,64 @@ def submit_score():
              -H "Content-Type: application/json" \
              -d '{"guesses": 4, "time_seconds": 120, "puzzle_date": "2026-02-02"}'
     """
+    # Cheap guards before any parsing: cap body size and require the JSON
+    # content type, so malformed or oversized requests cost O(1)
+    if request.content_length is not None and request.content_length > MAX_BODY_BYTES:
+        return _resp({
+            "success": False,
+            "error": "Request body too large"
+        }, 413)
+
+    if request.mimetype != "application/json":
+        return _resp({
+            "success": False,
+            "error": "Content-Type must be application/json"
+        }, 415)
+
     try:
-        # Parse JSON request body
-        data = request.get_json()
+        # Parse JSON request body with orjson directly (skips Flask's
+        # content-type negotiation and caching layers)
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            data = None
 
         # Validate required fields are present
-        if not data:
-            return jsonify({
+        if not isinstance(data, dict) or not data:
+            return _resp({
                 "success": False,
                 "error": "Request body must be JSON"
-            }), 400
+            }, 400)
 
-        required_fields = ["guesses", "time_seconds", "puzzle_date"]
-        missing_fields = [field for field in required_fields if field not in data]
-
-        if missing_fields:
-            return jsonify({
-                "success": False,
-                "error": f"Missing required fields: {', '.join(missing_fields)}"
-            }), 400
-
-        # Extract and validate field values
-        guesses = data["guesses"]
-        time_seconds = data["time_seconds"]
-        puzzle_date = data["puzzle_date"]
-        username = data.get("username")  # Optional: use account name if provided
-
-        # Validate guesses is an integer between 1 and 6
-        if not isinstance(guesses, int) or not 1 <= guesses <= 6:
-            return jsonify({
+        # Validate all fields in one pass
+        error = _validate_score_payload(data)
+        if error is not None:
+            return _resp({
                 "success": False,
-                "error": "guesses must be an integer between 1 and 6"
-            }), 400
-
-        # Validate time_seconds is a positive integer
-        if not isinstance(time_seconds, int) or time_seconds < 0:
-            return jsonify({
-                "success": False,
-                "error": "time_seconds must be a non-negative integer"
-            }), 400
-
-        # Validate puzzle_date format (basic check for YYYY-MM-DD)
-        if not isinstance(puzzle_date, str) or len(puzzle_date) != 10:
-            return jsonify({
-                "success": False,
-                "error": "puzzle_date must be in YYYY-MM-DD format"
-            }), 400
+                "error": error
+            }, 400)
 
         # Submit the score using the service
         score = leaderboard_service.submit_score(
-            guesses=guesses,
-            time_seconds=time_seconds,
-            puzzle_date=puzzle_date,
-            username=username
+            guesses=data["guesses"],
+            time_seconds=data["time_seconds"],
+            puzzle_date=data["puzzle_date"],
+            username=data.get("username")  # Optional: account name if provided
         )
 
-        # Return success response with created score
-        return jsonify({
+        # Return success response with created score — orjson serializes
+        # the dataclass directly, no intermediate dict
+        return _resp({
             "success": True,
-            "score": score.to_dict()
-        }), 201
+            "score": score
+        }, 201)
 
     except ValueError as e:
         # Handle validation errors from the service
-        return jsonify({
+        return _resp({
             "success": False,
             "error": str(e)
-        }), 400
-
-    except Exception as e:
-        # Handle unexpected errors
-        return jsonify({
-            "success": False,
-            "error": f"Internal server error: {str(e)}"
-        }), 500
+        }, 400)
 
 
 # ------------------------------------------------------------------------------
@@ -191,35 +235,37 @@ def get_leaderboard(puzzle_date: str):
         curl http://localhost:8080/api/leaderboard/2026-02-02?limit=3
     """
     try:
-        # Validate puzzle_date format (basic check)
-        if len(puzzle_date) != 10 or puzzle_date[4] != "-" or puzzle_date[7] != "-":
-            return jsonify({
+        # Validate puzzle_date format (YYYY-MM-DD)
+        if not _DATE_RE.fullmatch(puzzle_date):
+            return _resp({
                 "success": False,
                 "error": "Invalid date format. Use YYYY-MM-DD"
-            }), 400
+            }, 400)
 
         # Get optional limit parameter (default: 5, max: 10)
         limit = request.args.get("limit", default=5, type=int)
         limit = min(max(1, limit), 10)  # Clamp between 1 and 10
 
-        # Get leaderboard from service
-        entries = leaderboard_service.get_leaderboard(puzzle_date, limit=limit)
+        # Get the pre-encoded response body from the service cache
+        body, etag = leaderboard_service.get_leaderboard_bytes(puzzle_date, limit=limit)
 
-        # Convert entries to dictionaries for JSON response
-        leaderboard_data = [entry.to_dict() for entry in entries]
+        # Polling clients echo the ETag back; when the leaderboard hasn't
+        # changed, reply 304 with no body at all
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=304, headers={"ETag": etag})
 
-        return jsonify({
-            "success": True,
-            "puzzle_date": puzzle_date,
-            "leaderboard": leaderboard_data
-        }), 200
+        return Response(
+            body, 200,
+            mimetype="application/json",
+            headers={"ETag": etag}
+        )
 
-    except Exception as e:
-        # Handle unexpected errors
-        return jsonify({
+    except ValueError:
+        # Regex-valid shape but not a real calendar date (e.g. 2026-13-01)
+        return _resp({
             "success": False,
-            "error": f"Internal server error: {str(e)}"
-        }), 500
+            "error": "Invalid date format. Use YYYY-MM-DD"
+        }, 400)
 
 
 # ------------------------------------------------------------------------------
@@ -240,7 +286,4 @@ def health_check():
     Example curl:
         curl http://localhost:8080/api/leaderboard/health
     """
-    return jsonify({
-        "status": "healthy",
-        "service": "wordle-leaderboard"
-    }), 200
+    return Response(_HEALTH_BODY, 200, mimetype="application/json")
@@ -23,8 +23,12 @@
 #
 
 import os
-from flask import Flask, jsonify, send_file
+import orjson
+from flask import Flask, Response, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 from dotenv import load_dotenv
 
 # Load environment variables BEFORE importing blueprints.
@@ -43,6 +47,69 @@ from api.config import config_bp
 from api.social import social_bp
 
 
+# ------------------------------------------------------------------------------
+# MARK: - JSON Provider
+# ------------------------------------------------------------------------------
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    orjson is a C extension that serializes/parses JSON several times faster
+    than the stdlib json module, which matters for the small-dict payloads
+    (leaderboard entries, score submissions) this API serves at volume.
+
+    Types orjson doesn't handle natively (Decimal, Markup, datetime
+    subclasses like Firestore's DatetimeWithNanoseconds) fall through to
+    DefaultJSONProvider's default hook instead of raising.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Root endpoint body — fixed API directory, encoded once at import
+_INDEX_BODY = orjson.dumps({
+    "service": "TapIn Backend API",
+    "version": "1.0.0",
+    "endpoints": {
+        "submit_score": "POST /api/leaderboard/score",
+        "get_leaderboard": "GET /api/leaderboard/<date>",
+        "health_check": "GET /api/leaderboard/health",
+        "summarize_event": "POST /api/claude/summarize",
+        "claude_chat": "POST /api/claude/chat",
+        "claude_health": "GET /api/claude/health",
+        "get_events": "GET /api/events",
+        "refresh_events": "POST /api/events/refresh",
+        "events_health": "GET /api/events/health",
+        "get_articles": "GET /api/articles?category=all",
+        "get_article_content": "GET /api/articles/content?url=<encoded_url>",
+        "daily_briefing": "GET /api/articles/daily-briefing",
+        "refresh_articles": "POST /api/articles/refresh",
+        "articles_health": "GET /api/articles/health",
+        "auth_apple": "POST /api/users/auth/apple",
+        "auth_google": "POST /api/users/auth/google",
+        "auth_phone": "POST /api/users/auth/phone",
+        "register": "POST /api/users/register",
+        "login": "POST /api/users/login",
+        "user_profile": "GET /api/users/me",
+        "users_health": "GET /api/users/health",
+        "pipes_daily": "GET /api/pipes/daily",
+        "pipes_daily_five": "GET /api/pipes/daily-five?date=YYYY-MM-DD",
+        "pipes_health": "GET /api/pipes/health",
+        "track_dau_event": "POST /api/analytics/track",
+        "query_dau": "GET /api/analytics/dau",
+        "analytics_health": "GET /api/analytics/health",
+        "dau_dashboard": "GET /api/analytics/dashboard",
+        "privacy_policy": "GET /privacy",
+        "terms_of_service": "GET /terms",
+    }
+})
+
+
 # ------------------------------------------------------------------------------
 # MARK: - Application Factory
 # ------------------------------------------------------------------------------
@@ -67,6 +134,23 @@ def create_app() -> Flask:
     # Create Flask app instance
     app = Flask(__name__)
 
+    # Use orjson for all JSON serialization/parsing (jsonify, request.get_json)
+    app.json = OrjsonProvider(app)
+
+    # Disable pretty-printing and key sorting so the stdlib fallback path
+    # never inserts whitespace or re-orders keys
+    app.config["JSONIFY_PRETTYPRINT_REGULAR"] = False
+    app.config["JSON_SORT_KEYS"] = False
+
+    # Compress JSON responses (brotli with gzip fallback, negotiated via
+    # Accept-Encoding). Leaderboard payloads — repeated field names plus
+    # emoji runs — shrink several times over on the wire, which matters
+    # for clients on cellular
+    app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_LEVEL"] = 4
+    Compress(app)
+
     # --------------------------------------------------------------------------
     # MARK: - CORS Configuration
     # --------------------------------------------------------------------------
@@ -141,47 +225,11 @@ def create_app() -> Flask:
                 }
             }
         """
-        return jsonify({
-            "service": "TapIn Backend API",
-            "version": "1.0.0",
-            "endpoints": {
-                "submit_score": "POST /api/leaderboard/score",
-                "get_leaderboard": "GET /api/leaderboard/<date>",
-                "health_check": "GET /api/leaderboard/health",
-                "summarize_event": "POST /api/claude/summarize",
-                "claude_chat": "POST /api/claude/chat",
-                "claude_health": "GET /api/claude/health",
-                "get_events": "GET /api/events",
-                "refresh_events": "POST /api/events/refresh",
-                "events_health": "GET /api/events/health",
-                "get_articles": "GET /api/articles?category=all",
-                "get_article_content": "GET /api/articles/content?url=<encoded_url>",
-                "daily_briefing": "GET /api/articles/daily-briefing",
-                "refresh_articles": "POST /api/articles/refresh",
-                "articles_health": "GET /api/articles/health",
-                "auth_apple": "POST /api/users/auth/apple",
-                "auth_google": "POST /api/users/auth/google",
-                "auth_phone": "POST /api/users/auth/phone",
-                "register": "POST /api/users/register",
-                "login": "POST /api/users/login",
-                "user_profile": "GET /api/users/me",
-                "users_health": "GET /api/users/health",
-                "pipes_daily": "GET /api/pipes/daily",
-                "pipes_daily_five": "GET /api/pipes/daily-five?date=YYYY-MM-DD",
-                "pipes_health": "GET /api/pipes/health",
-                "track_dau_event": "POST /api/analytics/track",
-                "query_dau": "GET /api/analytics/dau",
-                "analytics_health": "GET /api/analytics/health",
-                "dau_dashboard": "GET /api/analytics/dashboard",
-                "privacy_policy": "GET /privacy",
-                "terms_of_service": "GET /terms",
-            }
-        })
+        return Response(_INDEX_BODY, 200, mimetype="application/json")
 
     # --------------------------------------------------------------------------
     # MARK: - Legal Pages
     # --------------------------------------------------------------------------
-
     @app.route("/privacy")
     def privacy_policy():
         """Serve the Privacy Policy HTML page."""
@@ -222,6 +270,24 @@ def create_app() -> Flask:
             "error": "Internal server error"
         }), 500
 
+    @app.errorhandler(Exception)
+    def unhandled_exception(error):
+        """
+        Catch-all for uncaught exceptions from any route.
+
+        Routes no longer need their own try/except Exception wrappers;
+        the error is logged with its traceback here and the client gets
+        a generic message instead of implementation details.
+        """
+        if isinstance(error, HTTPException):
+            return error
+
+        app.logger.exception(error)
+        return jsonify({
+            "success": False,
+            "error": "Internal server error"
+        }), 500
+
     return app
 
 
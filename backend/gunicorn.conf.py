@@ -0,0 +1,32 @@
+#
+#  gunicorn.conf.py
+#  TapInApp - Backend Server
+#
+#  MARK: - Gunicorn Configuration
+#  Production WSGI server settings, picked up automatically by gunicorn
+#  from the working directory (Dockerfile and app.yaml entrypoints).
+#
+#  Worker model:
+#  - gthread gives each worker a thread pool, so requests blocked on
+#    Firestore / Claude API I/O don't serialize behind each other the
+#    way the default sync worker does.
+#  - gevent was considered but the Firestore client speaks gRPC, which
+#    does not cooperate with gevent monkey-patching.
+#
+
+import multiprocessing
+
+# Threaded workers for I/O-bound request handling
+worker_class = "gthread"
+workers = multiprocessing.cpu_count() * 2 + 1
+threads = 8
+
+# Import the app once in the master before forking workers
+preload_app = True
+
+# Match the timeout previously passed on the Docker command line
+timeout = 120
+
+# Hold idle connections open so polling clients reuse them instead of
+# paying a TCP/TLS handshake per request
+keepalive = 5
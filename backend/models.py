@@ -18,12 +18,19 @@ from datetime import date
 from typing import Optional
 import uuid
 
+_uuid4 = uuid.uuid4
+
+
+def _new_id() -> str:
+    """Generates a 32-char hex ID (uuid4 without the hyphen formatting)."""
+    return _uuid4().hex
+
 
 # ------------------------------------------------------------------------------
 # MARK: - Score Model
 # ------------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Score:
     """
     Represents a player's score for a Wordle game.
@@ -48,7 +55,7 @@ class Score:
     guesses: int
     time_seconds: int
     puzzle_date: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
 
     def to_dict(self) -> dict:
         """
@@ -77,7 +84,7 @@ class Score:
             Score instance
         """
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data.get("id") or _new_id(),
             username=data["username"],
             guesses=data["guesses"],
             time_seconds=data["time_seconds"],
@@ -89,7 +96,7 @@ class Score:
 # MARK: - LeaderboardEntry Model
 # ------------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class LeaderboardEntry:
     """
     Represents a formatted leaderboard entry for display.
@@ -139,7 +146,7 @@ class LeaderboardEntry:
 # MARK: - Pipes Score Model
 # ------------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PipesScore:
     """
     Represents a player's score for a Pipes daily-five session.
@@ -157,7 +164,7 @@ class PipesScore:
     total_moves: int
     total_time_seconds: int
     puzzle_date: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
 
     def to_dict(self) -> dict:
         return {
@@ -172,7 +179,7 @@ class PipesScore:
     @classmethod
     def from_dict(cls, data: dict) -> "PipesScore":
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data.get("id") or _new_id(),
             username=data["username"],
             puzzles_completed=data["puzzles_completed"],
             total_moves=data["total_moves"],
@@ -185,7 +192,7 @@ class PipesScore:
 # MARK: - Pipes Leaderboard Entry Model
 # ------------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PipesLeaderboardEntry:
     """
     Formatted leaderboard entry for Pipes display.
@@ -17,14 +17,29 @@
 #  - Collection: wordle_scores / {puzzle_date} / scores / {score_id}
 #
 
+import hashlib
 import logging
+import os
 import random
-from typing import List, Optional
+import threading
+import time
+from bisect import insort
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+import redis
 from models import Score, LeaderboardEntry
 from services.firestore_client import get_firestore_client
 
 logger = logging.getLogger(__name__)
 
+# Optional shared ranking layer (e.g. Cloud Memorystore). When set, each
+# date's top scores live in a Redis sorted set visible to every worker
+# and instance; when unset, ranking stays in the per-process cache.
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
 
 # ------------------------------------------------------------------------------
 # MARK: - Username Generation Data
@@ -46,9 +61,61 @@ NOUNS = [
     "Legend", "Pioneer", "Voyager", "Ranger", "Scout"
 ]
 
+# Every Adjective+Noun combination, precomputed so generating a username
+# is a single RNG call and a table index (no per-call concatenation)
+_USERNAMES = tuple(a + n for a in ADJECTIVES for n in NOUNS)
+_USERNAME_COUNT = len(_USERNAMES)
+
 # Firestore collection name
 SCORES_COLLECTION = "wordle_scores"
 
+# Emoji display strings indexed by guess count (guesses is always 1-6),
+# precomputed so entry building is a tuple index instead of a string multiply
+_EMOJI = tuple("🟩" * n for n in range(7))
+
+# Redis key prefix for the per-date sorted sets
+_REDIS_KEY_PREFIX = "wordle_lb:"
+
+# Daily leaderboards go stale quickly — expire their sorted sets after a week
+_REDIS_TTL_SECONDS = 7 * 86400
+
+# Multiplier folding (guesses, time_seconds) into a single sorted-set
+# score while preserving the composite ordering; no puzzle takes a
+# million seconds
+_ZSCORE_TIME_RANGE = 1_000_000
+
+# Cap on cached entries per date. The API never serves more than 10
+# entries, so anything past the top 10 only wastes memory; bounding the
+# buckets keeps hot-date memory flat no matter how many scores come in.
+MAX_LEADERBOARD = 10
+
+# How long a date's cached bucket (and the response bodies derived from
+# it) may be served before re-reading Firestore. Without Redis each
+# gunicorn worker has its own cache and never sees submissions handled
+# by other workers or instances, so the TTL bounds how stale any one
+# worker's leaderboard can get.
+_CACHE_TTL_SECONDS = 30
+
+
+def _format_guesses_emoji(guesses: int) -> str:
+    return _EMOJI[guesses]
+
+
+# Cached bucket rows: the ranking key followed by the Score itself.
+# Plain tuples compare at C level (no key callable), and the unique id
+# before the Score means comparisons never reach the dataclass.
+_ScoreRow = Tuple[int, int, str, Score]
+
+
+def _rank_row(score: Score) -> _ScoreRow:
+    """Bucket row: fewest guesses first, fastest time as tiebreaker."""
+    return (score.guesses, score.time_seconds, score.id, score)
+
+
+def _zscore(score: Score) -> int:
+    """Folds the ranking key into a single Redis sorted-set score."""
+    return score.guesses * _ZSCORE_TIME_RANGE + min(score.time_seconds, _ZSCORE_TIME_RANGE - 1)
+
 
 # ------------------------------------------------------------------------------
 # MARK: - LeaderboardService Class
@@ -57,17 +124,55 @@ SCORES_COLLECTION = "wordle_scores"
 class LeaderboardService:
     """
     Service class for managing Wordle leaderboard operations.
-    Backed by Firestore for persistent storage.
+    Backed by Firestore for persistent storage, with an in-process
+    per-date cache kept sorted by the ranking key so repeated reads
+    of a hot date skip both the Firestore round trip and the sort.
     """
 
+    def __init__(self):
+        # Per-date sorted cache of scores, keyed by datetime.date —
+        # hashes as a small int and canonicalizes inputs, unlike raw
+        # strings. Firestore is the source of truth; a date's bucket is
+        # filled on first read, kept up to date on this worker's writes,
+        # and re-read from Firestore once its TTL deadline passes so
+        # other workers' submissions show up within _CACHE_TTL_SECONDS.
+        self._scores: Dict[date, List[_ScoreRow]] = {}
+
+        # Monotonic deadline after which each date's bucket is refreshed
+        self._bucket_expires: Dict[date, float] = {}
+
+        # Pre-encoded JSON response bodies keyed by (puzzle_day, limit):
+        # (body, etag, expires). Invalidated when the date receives a new
+        # score through this worker, and expired alongside its bucket.
+        self._response_cache: Dict[Tuple[date, int], Tuple[bytes, str, float]] = {}
+
+        # Per-date write counter, bumped on every submission for the date
+        self._versions: Dict[date, int] = defaultdict(int)
+
+        # Per-date locks guarding cache mutation — gunicorn's threaded
+        # workers can run two submissions for the same date concurrently.
+        # Reads stay lock-free: bucket slices copy, and dict operations
+        # are atomic under the GIL.
+        self._locks: Dict[date, threading.RLock] = defaultdict(threading.RLock)
+
+        # Shared Redis ranking layer, enabled by REDIS_URL. Connection
+        # problems fall back to the in-process cache rather than failing.
+        self._redis: Optional[redis.Redis] = None
+        if REDIS_URL:
+            try:
+                self._redis = redis.Redis.from_url(REDIS_URL, socket_timeout=2)
+                self._redis.ping()
+                logger.info("Leaderboard Redis ranking layer enabled")
+            except Exception as e:
+                logger.error(f"Redis unavailable, using in-process cache: {e}")
+                self._redis = None
+
     # --------------------------------------------------------------------------
     # MARK: - Username Generation
     # --------------------------------------------------------------------------
 
     def generate_username(self) -> str:
-        adjective = random.choice(ADJECTIVES)
-        noun = random.choice(NOUNS)
-        return f"{adjective}{noun}"
+        return _USERNAMES[random.randrange(_USERNAME_COUNT)]
 
     # --------------------------------------------------------------------------
     # MARK: - Score Submission
@@ -86,6 +191,12 @@ class LeaderboardService:
         if not 1 <= guesses <= 6:
             raise ValueError("Guesses must be between 1 and 6")
 
+        # Normalize the date once: rejects non-canonical strings like
+        # "2026-2-2" at the boundary and gives the cache a key that
+        # hashes as an int instead of a string
+        puzzle_day = date.fromisoformat(puzzle_date)
+        puzzle_date = puzzle_day.isoformat()
+
         if username is None:
             username = self.generate_username()
 
@@ -110,39 +221,142 @@ class LeaderboardService:
             logger.error(f"Failed to save score to Firestore: {e}")
             # Still return the score so the user gets a response
 
+        # Mirror into the shared Redis sorted set when enabled: O(log N)
+        # insert, trim to the top entries, and refresh the TTL in one
+        # round trip
+        if self._redis is not None:
+            try:
+                key = _REDIS_KEY_PREFIX + puzzle_date
+                pipe = self._redis.pipeline()
+                pipe.zadd(key, {orjson.dumps(score): _zscore(score)})
+                pipe.zremrangebyrank(key, MAX_LEADERBOARD, -1)
+                pipe.expire(key, _REDIS_TTL_SECONDS)
+                pipe.execute()
+            except Exception as e:
+                logger.error(f"Failed to update Redis leaderboard: {e}")
+
+        # Keep the sorted cache current; insort on a <=10-element list is
+        # a C-level tuple search plus a tiny memmove. A date that has
+        # never been read stays uncached until its first GET. The id
+        # check covers a first-read _get_bucket racing this method: the
+        # Firestore stream above can already contain this score, and
+        # inserting it twice would duplicate the row.
+        with self._locks[puzzle_day]:
+            bucket = self._scores.get(puzzle_day)
+            if bucket is not None and not any(row[2] == score.id for row in bucket):
+                insort(bucket, _rank_row(score))
+                if len(bucket) > MAX_LEADERBOARD:
+                    bucket.pop()
+
+            # Invalidate any pre-encoded responses for this date
+            self._versions[puzzle_day] += 1
+            for key in list(self._response_cache):
+                if key[0] == puzzle_day:
+                    del self._response_cache[key]
+
         return score
 
     # --------------------------------------------------------------------------
     # MARK: - Leaderboard Retrieval
     # --------------------------------------------------------------------------
 
-    def get_leaderboard(self, puzzle_date: str, limit: int = 5) -> List[LeaderboardEntry]:
+    def _get_bucket(self, puzzle_day: date) -> Optional[List[_ScoreRow]]:
         """
-        Retrieves the top scores for a specific puzzle date from Firestore.
-        Ranked by fewest guesses, then fastest time.
+        Returns the sorted score bucket for a date, filling it from
+        Firestore on the first read and re-reading once the bucket's TTL
+        passes. Returns None if the read fails and there is no previous
+        bucket to fall back on.
+        """
+        bucket = self._scores.get(puzzle_day)
+        if bucket is not None and time.monotonic() < self._bucket_expires.get(puzzle_day, 0.0):
+            return bucket
+
+        # Fill/refresh under the date's lock so a concurrent submission
+        # can't land between the Firestore read and the cache publish
+        with self._locks[puzzle_day]:
+            bucket = self._scores.get(puzzle_day)
+            if bucket is not None and time.monotonic() < self._bucket_expires.get(puzzle_day, 0.0):
+                return bucket
+
+            scores: List[Score] = []
+
+            try:
+                db = get_firestore_client()
+                docs = (
+                    db.collection(SCORES_COLLECTION)
+                      .document(puzzle_day.isoformat())
+                      .collection("scores")
+                      .stream()
+                )
+                for doc in docs:
+                    try:
+                        scores.append(Score.from_dict(doc.to_dict()))
+                    except (KeyError, TypeError) as e:
+                        logger.warning(f"Skipping malformed score doc {doc.id}: {e}")
+            except Exception as e:
+                logger.error(f"Failed to fetch leaderboard from Firestore: {e}")
+                # A stale bucket (or None on a first read) beats showing
+                # an empty leaderboard while Firestore is unreachable
+                return bucket
+
+            fresh = sorted(_rank_row(s) for s in scores)
+            del fresh[MAX_LEADERBOARD:]
+            self._scores[puzzle_day] = fresh
+            self._bucket_expires[puzzle_day] = time.monotonic() + _CACHE_TTL_SECONDS
+            return fresh
+
+    def _redis_top(self, puzzle_day: date, limit: int) -> Optional[List[Score]]:
+        """
+        Top scores for a date from the shared Redis sorted set,
+        backfilling the set from Firestore on a cold start. Returns None
+        when Redis is unusable so callers fall back to the in-process
+        cache.
         """
-        scores: List[Score] = []
+        key = _REDIS_KEY_PREFIX + puzzle_day.isoformat()
 
         try:
-            db = get_firestore_client()
-            docs = (
-                db.collection(SCORES_COLLECTION)
-                  .document(puzzle_date)
-                  .collection("scores")
-                  .stream()
-            )
-            for doc in docs:
-                try:
-                    scores.append(Score.from_dict(doc.to_dict()))
-                except (KeyError, TypeError) as e:
-                    logger.warning(f"Skipping malformed score doc {doc.id}: {e}")
+            members = self._redis.zrange(key, 0, limit - 1)
+
+            if not members:
+                # Cold (or expired) sorted set — rebuild it from the
+                # Firestore-backed bucket
+                bucket = self._get_bucket(puzzle_day)
+                if bucket is None:
+                    return None
+                if bucket:
+                    pipe = self._redis.pipeline()
+                    pipe.zadd(key, {orjson.dumps(row[3]): _zscore(row[3]) for row in bucket})
+                    pipe.expire(key, _REDIS_TTL_SECONDS)
+                    pipe.execute()
+                return [row[3] for row in bucket[:limit]]
+
+            return [Score.from_dict(orjson.loads(member)) for member in members]
+
         except Exception as e:
-            logger.error(f"Failed to fetch leaderboard from Firestore: {e}")
-            return []
+            logger.error(f"Failed to read Redis leaderboard: {e}")
+            return None
+
+    def get_leaderboard(self, puzzle_date: str, limit: int = 5) -> List[LeaderboardEntry]:
+        """
+        Retrieves the top scores for a specific puzzle date.
+        Ranked by fewest guesses, then fastest time.
 
-        # Sort by guesses (ascending), then by time (ascending) as tiebreaker
-        sorted_scores = sorted(scores, key=lambda s: (s.guesses, s.time_seconds))
-        top_scores = sorted_scores[:limit]
+        Served from the shared Redis sorted set when configured, else
+        from the sorted in-process cache; Firestore fills either one on
+        the first read of a date.
+        """
+        puzzle_day = date.fromisoformat(puzzle_date)
+
+        top_scores: Optional[List[Score]] = None
+        if self._redis is not None:
+            top_scores = self._redis_top(puzzle_day, limit)
+
+        if top_scores is None:
+            bucket = self._get_bucket(puzzle_day)
+            if bucket is None:
+                return []
+            # Already sorted — taking the top entries is O(limit)
+            top_scores = [row[3] for row in bucket[:limit]]
 
         entries = []
         for rank, score in enumerate(top_scores, start=1):
@@ -150,20 +364,88 @@ class LeaderboardService:
                 rank=rank,
                 username=score.username,
                 guesses=score.guesses,
-                guesses_display=self._format_guesses_emoji(score.guesses),
+                guesses_display=_format_guesses_emoji(score.guesses),
                 time_seconds=score.time_seconds
             )
             entries.append(entry)
 
         return entries
 
-    # --------------------------------------------------------------------------
-    # MARK: - Helper Methods
-    # --------------------------------------------------------------------------
+    def get_leaderboard_bytes(self, puzzle_date: str, limit: int = 5) -> Tuple[bytes, str]:
+        """
+        Returns the full GET response body for a puzzle date as pre-encoded
+        JSON bytes, plus its weak ETag.
+
+        Cached per (date, limit) so repeat reads of an unchanged
+        leaderboard skip entry building and serialization entirely.
+        """
+        puzzle_day = date.fromisoformat(puzzle_date)
+        puzzle_date = puzzle_day.isoformat()
 
-    def _format_guesses_emoji(self, guesses: int) -> str:
-        return "🟩" * guesses
+        # With the shared Redis layer, another worker or instance can
+        # change a date's leaderboard at any time, so skip the local
+        # response cache and derive the ETag from the body itself
+        if self._redis is not None:
+            top_scores = self._redis_top(puzzle_day, limit)
+            if top_scores is not None:
+                body = self._encode_leaderboard(puzzle_date, top_scores)
+                etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+                return body, etag
 
+        cached = self._response_cache.get((puzzle_day, limit))
+        if cached is not None and time.monotonic() < cached[2]:
+            return cached[0], cached[1]
+
+        # Snapshot the write counter before reading the bucket so a
+        # submission that lands while we encode is detectable below
+        version = self._versions[puzzle_day]
+
+        bucket = self._get_bucket(puzzle_day)
+        top_scores = [row[3] for row in bucket[:limit]] if bucket is not None else []
+
+        # ETag comes from the body itself, never from per-process state:
+        # each worker's version counter starts at zero, so two workers
+        # could otherwise serve different bodies under the same ETag and
+        # trigger false 304s
+        body = self._encode_leaderboard(puzzle_date, top_scores)
+        etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+
+        # Only cache if the score bucket was actually filled — a Firestore
+        # read failure leaves the date uncached and should be retried.
+        # The entry expires with its bucket so a refreshed bucket is
+        # never hidden behind an older cached body. Storing happens under
+        # the date's lock, and only if no submission bumped the version
+        # since the snapshot — otherwise this body predates the write and
+        # caching it would undo the submission's invalidation.
+        if bucket is not None:
+            with self._locks[puzzle_day]:
+                if self._versions[puzzle_day] == version:
+                    self._response_cache[(puzzle_day, limit)] = (
+                        body, etag, self._bucket_expires.get(puzzle_day, 0.0)
+                    )
+
+        return body, etag
+
+    def _encode_leaderboard(self, puzzle_date: str, top_scores: List[Score]) -> bytes:
+        """
+        Encodes the GET response body for a ranked list of scores as
+        plain dict literals — no intermediate LeaderboardEntry/to_dict
+        churn on the hot path.
+        """
+        return orjson.dumps({
+            "success": True,
+            "puzzle_date": puzzle_date,
+            "leaderboard": [
+                {
+                    "rank": rank,
+                    "username": score.username,
+                    "guesses": score.guesses,
+                    "guesses_display": _EMOJI[score.guesses],
+                    "time_seconds": score.time_seconds
+                }
+                for rank, score in enumerate(top_scores, start=1)
+            ]
+        })
 
 # ------------------------------------------------------------------------------
 # MARK: - Module-level Instance